@@ -1,10 +1,8 @@
-from copy import deepcopy
-
 import numpy as np
 
-from qutip import qeye, tensor, destroy, basis
-from .processor import Model
-from .modelprocessor import ModelProcessor, _to_array
+from qutip import Qobj
+from .processor import Model, is_qutip5
+from .modelprocessor import ModelProcessor, _broadcast_params
 from ..transpiler import to_chain_structure
 from ..compiler import SCQubitsCompiler
 from ..noise import ZZCrossTalk
@@ -14,6 +12,49 @@ from ..operations import expand_operator
 __all__ = ["SCQubits"]
 
 
+# Dense single-transmon operators, keyed on the number of levels and
+# shared by all models. ``x`` and ``y`` are the two control quadratures,
+# ``z01`` and ``x01`` the Pauli operators projected to the qubit subspace.
+# The default three-level truncation is written out explicitly.
+_TRANSMON_OPS = {
+    3: {
+        "x": np.array(
+            [[0.0, 1.0, 0.0], [1.0, 0.0, np.sqrt(2)], [0.0, np.sqrt(2), 0.0]]
+        ),
+        "y": np.array(
+            [
+                [0.0, -1j, 0.0],
+                [1j, 0.0, -1j * np.sqrt(2)],
+                [0.0, 1j * np.sqrt(2), 0.0],
+            ]
+        ),
+        "num": np.diag([0.0, 1.0, 2.0]),
+        "z01": np.diag([1.0, -1.0, 0.0]),
+        "x01": np.array([[0.0, 1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 0.0]]),
+    }
+}
+
+
+def _transmon_ops(d):
+    """
+    Return the dense operators of a transmon truncated at ``d`` levels,
+    computing them on the first request for this dimension.
+    """
+    if d not in _TRANSMON_OPS:
+        destroy_op = np.diag(np.sqrt(np.arange(1.0, d)), 1)
+        create_op = destroy_op.T
+        # projector to the 0 and 1 subspace
+        proj01 = np.diag((np.arange(d) < 2).astype(float))
+        _TRANSMON_OPS[d] = {
+            "x": destroy_op + create_op,
+            "y": 1j * (create_op - destroy_op),
+            "num": np.diag(np.arange(d, dtype=float)),
+            "z01": proj01 @ np.diag(1.0 - 2.0 * np.arange(d)) @ proj01,
+            "x01": proj01 @ (destroy_op + create_op) @ proj01,
+        }
+    return _TRANSMON_OPS[d]
+
+
 class SCQubits(ModelProcessor):
     """
     A chain of superconducting qubits with fixed frequency
@@ -134,17 +175,18 @@ class SCQubitsModel(Model):
         If ZZ cross-talk is included.
     **params:
         Keyword arguments for hardware parameters, in the unit of GHz.
-        Each should be given as list:
+        Each should be given as list, a scalar is used for all elements.
+        If a list is longer than required, only the first entries are used:
 
         - wq : list, optional
             Qubits bare frequency, default 5.15 and 5.09
             for each pair of superconducting qubits,
             default ``[5.15, 5.09, 5.15, ...]``.
         - wr : list, optional
-            Resonator bare frequency, default ``[5.96]*num_qubits``.
+            Resonator bare frequency, default ``[5.96]*(num_qubits - 1)``.
         - g : list, optional
             The coupling strength between the resonator and the qubits,
-            default ``[0.1]*(num_qubits - 1)``.
+            default ``[0.1]*(2 * (num_qubits - 1))``.
         - alpha : list, optional
             Anharmonicity for each superconducting qubit,
             default ``[-0.3]*num_qubits``.
@@ -165,18 +207,24 @@ class SCQubitsModel(Model):
         self.num_qubits = num_qubits
         self.dims = dims if dims is not None else [3] * num_qubits
         self.params = {
-            "wq": np.array(
-                ((5.15, 5.09) * int(np.ceil(self.num_qubits / 2)))[
-                    : self.num_qubits
-                ]
-            ),
-            "wr": 5.96,
-            "alpha": -0.3,
-            "g": 0.1,
-            "omega_single": 0.01,
-            "omega_cr": 0.01,
+            "wq": np.tile(np.array([5.15, 5.09]), (num_qubits + 1) // 2)[
+                :num_qubits
+            ],
+            "wr": np.full(num_qubits - 1, 5.96),
+            "alpha": np.full(num_qubits, -0.3),
+            "g": np.full(2 * (num_qubits - 1), 0.1),
+            "omega_single": np.full(num_qubits, 0.01),
+            "omega_cr": np.full(num_qubits, 0.01),
         }
-        self.params.update(deepcopy(params))
+        # Copy mutable values so that the caller's arrays are not modified.
+        for key, value in params.items():
+            if isinstance(value, np.ndarray):
+                value = value.copy()
+            elif isinstance(value, list):
+                value = value[:]
+            self.params[key] = value
+        self._latex_cache = None
+        self._label_map_cache = None
         self._compute_params()
         self._drift = []
         self._set_up_drift()
@@ -187,21 +235,30 @@ class SCQubitsModel(Model):
 
     def _set_up_drift(self):
         for m in range(self.num_qubits):
-            destroy_op = destroy(self.dims[m])
+            d = self.dims[m]
             coeff = 2 * np.pi * self.params["alpha"][m] / 2.0
-            self._drift.append(
-                (coeff * destroy_op.dag() ** 2 * destroy_op**2, [m])
+            # a^dag a^dag a a = n (n - 1) is diagonal in the Fock basis
+            levels = np.arange(d)
+            op = Qobj(
+                coeff * np.diag(levels * (levels - 1.0)),
+                dims=[[d], [d]],
+                isherm=True,
             )
+            if is_qutip5:
+                op = op.to("dia")
+            self._drift.append((op, [m]))
 
     @property
     def _old_index_label_map(self):
-        num_qubits = self.num_qubits
-        return (
-            ["sx" + str(i) for i in range(num_qubits)]
-            + ["sy" + str(i) for i in range(num_qubits)]
-            + ["zx" + str(i) + str(i + 1) for i in range(num_qubits)]
-            + ["zx" + str(i + 1) + str(i) for i in range(num_qubits)]
-        )
+        if self._label_map_cache is None:
+            num_qubits = self.num_qubits
+            self._label_map_cache = (
+                ["sx" + str(i) for i in range(num_qubits)]
+                + ["sy" + str(i) for i in range(num_qubits)]
+                + ["zx" + str(i) + str(i + 1) for i in range(num_qubits)]
+                + ["zx" + str(i + 1) + str(i) for i in range(num_qubits)]
+            )
+        return self._label_map_cache
 
     def _set_up_controls(self):
         """
@@ -213,52 +270,39 @@ class SCQubitsModel(Model):
         dims = self.dims
         controls = {}
 
+        # Both quadratures in one pass, the sy labels still follow all sx.
+        sy_controls = {}
         for m in range(num_qubits):
-            destroy_op = destroy(dims[m])
-            op = destroy_op + destroy_op.dag()
-            controls["sx" + str(m)] = (2 * np.pi / 2 * op, [m])
-
-        for m in range(num_qubits):
-            destroy_op = destroy(dims[m])
-            op = destroy_op * (-1.0j) + destroy_op.dag() * 1.0j
-            controls["sy" + str(m)] = (2 * np.pi / 2 * op, [m])
+            d = dims[m]
+            ops = _transmon_ops(d)
+            sx = Qobj(np.pi * ops["x"], dims=[[d], [d]], isherm=True)
+            sy = Qobj(np.pi * ops["y"], dims=[[d], [d]], isherm=True)
+            controls["sx" + str(m)] = (sx, [m])
+            sy_controls["sy" + str(m)] = (sy, [m])
+        controls.update(sy_controls)
 
         for m in range(num_qubits):
-            destroy_op = destroy(dims[m])
-            op = destroy_op.dag() * destroy_op
-            controls["sz" + str(m)] = (2 * np.pi * op, [m])
+            d = dims[m]
+            op = Qobj(
+                2 * np.pi * _transmon_ops(d)["num"],
+                dims=[[d], [d]],
+                isherm=True,
+            )
+            controls["sz" + str(m)] = (op, [m])
 
         for m in range(num_qubits - 1):
             # For simplicity, we neglect leakage in two-qubit gates.
             d1 = dims[m]
             d2 = dims[m + 1]
-            # projector to the 0 and 1 subspace
-            projector1 = (
-                basis(d1, 0) * basis(d1, 0).dag()
-                + basis(d1, 1) * basis(d1, 1).dag()
-            )
-            projector2 = (
-                basis(d2, 0) * basis(d2, 0).dag()
-                + basis(d2, 1) * basis(d2, 1).dag()
-            )
-            destroy_op1 = destroy(d1)
+            ops1 = _transmon_ops(d1)
+            ops2 = _transmon_ops(d2)
             # Notice that this is actually 2πZX/4
-            z = (
-                projector1
-                * (-destroy_op1.dag() * destroy_op1 * 2 + qeye(d1))
-                / 2
-                * projector1
-            )
-            destroy_op2 = destroy(d2)
-            x = projector2 * (destroy_op2.dag() + destroy_op2) / 2 * projector2
-            controls["zx" + str(m) + str(m + 1)] = (
-                2 * np.pi * tensor([z, x]),
-                [m, m + 1],
-            )
-            controls["zx" + str(m + 1) + str(m)] = (
-                2 * np.pi * tensor([x, z]),
-                [m, m + 1],
-            )
+            zx = np.kron(ops1["z01"], ops2["x01"])
+            xz = np.kron(ops1["x01"], ops2["z01"])
+            zx = Qobj(np.pi / 2 * zx, dims=[[d1, d2], [d1, d2]], isherm=True)
+            xz = Qobj(np.pi / 2 * xz, dims=[[d1, d2], [d1, d2]], isherm=True)
+            controls["zx" + str(m) + str(m + 1)] = (zx, [m, m + 1])
+            controls["zx" + str(m + 1) + str(m)] = (xz, [m, m + 1])
         return controls
 
     def _compute_params(self):
@@ -266,70 +310,65 @@ class SCQubitsModel(Model):
         Compute the dressed frequency and the interaction strength.
         """
         num_qubits = self.num_qubits
-        for name in ["alpha", "omega_single", "omega_cr"]:
-            self.params[name] = _to_array(self.params[name], num_qubits)
-        self.params["wr"] = _to_array(self.params["wr"], num_qubits - 1)
-        self.params["g"] = _to_array(self.params["g"], 2 * (num_qubits - 1))
+        self.params.update(
+            _broadcast_params(
+                self.params,
+                {
+                    "wq": num_qubits,
+                    "alpha": num_qubits,
+                    "omega_single": num_qubits,
+                    "omega_cr": num_qubits,
+                    "wr": num_qubits - 1,
+                    "g": 2 * (num_qubits - 1),
+                },
+            )
+        )
         g = self.params["g"]
         wq = self.params["wq"]
         wr = self.params["wr"]
         alpha = self.params["alpha"]
+        # Coupling of qubit i and i+1 to the resonator i in between
+        g_left = g[0::2]
+        g_right = g[1::2]
         # Dressed qubit frequency
-        wq_dr = []
-        for i in range(num_qubits):
-            tmp = wq[i]
-            if i != 0:
-                tmp += g[2 * i - 1] ** 2 / (wq[i] - wr[i - 1])
-            if i != (num_qubits - 1):
-                tmp += g[2 * i] ** 2 / (wq[i] - wr[i])
-            wq_dr.append(tmp)
+        wq_dr = wq.copy()
+        wq_dr[1:] += g_right**2 / (wq[1:] - wr)
+        wq_dr[:-1] += g_left**2 / (wq[:-1] - wr)
         self.params["wq_dressed"] = wq_dr
         # Dressed resonator frequency
-        wr_dr = []
-        for i in range(num_qubits - 1):
-            tmp = wr[i]
-            tmp -= g[2 * i] ** 2 / (wq[i] - wr[i] + alpha[i])
-            tmp -= g[2 * i + 1] ** 2 / (wq[i + 1] - wr[i] + alpha[i])
-            wr_dr.append(tmp)
+        wr_dr = (
+            wr
+            - g_left**2 / (wq[:-1] - wr + alpha[:-1])
+            - g_right**2 / (wq[1:] - wr + alpha[:-1])
+        )
         self.params["wr_dressed"] = wr_dr
         # Effective qubit coupling strength
-        J = []
-        for i in range(num_qubits - 1):
-            tmp = (
-                g[2 * i]
-                * g[2 * i + 1]
-                * (wq[i] + wq[i + 1] - 2 * wr[i])
-                / 2
-                / (wq[i] - wr[i])
-                / (wq[i + 1] - wr[i])
-            )
-            J.append(tmp)
+        J = (
+            g_left
+            * g_right
+            * (wq[:-1] + wq[1:] - 2 * wr)
+            / 2
+            / (wq[:-1] - wr)
+            / (wq[1:] - wr)
+        )
         self.params["J"] = J
         # Effective ZX strength
-        zx_coeff = []
         omega_cr = self.params["omega_cr"]
-        for i in range(num_qubits - 1):
-            tmp = (
-                J[i]
-                * omega_cr[i]
-                * (
-                    1 / (wq[i] - wq[i + 1] + alpha[i])
-                    - 1 / (wq[i] - wq[i + 1])
-                )
-            )
-            zx_coeff.append(tmp)
-        for i in range(num_qubits - 1, 0, -1):
-            tmp = (
-                J[i - 1]
-                * omega_cr[i]
-                * (
-                    1 / (wq[i] - wq[i - 1] + alpha[i])
-                    - 1 / (wq[i] - wq[i - 1])
-                )
-            )
-            zx_coeff.append(tmp)
+        detuning = wq[:-1] - wq[1:]
+        zx_coeff = np.concatenate(
+            [
+                J
+                * omega_cr[:-1]
+                * (1 / (detuning + alpha[:-1]) - 1 / detuning),
+                (
+                    J
+                    * omega_cr[1:]
+                    * (1 / (-detuning + alpha[1:]) - 1 / (-detuning))
+                )[::-1],
+            ]
+        )
         # Times 2 because we use -2πZX/4 as operators
-        self.params["zx_coeff"] = np.asarray(zx_coeff) * 2
+        self.params["zx_coeff"] = zx_coeff * 2
 
     def get_control_latex(self):
         """
@@ -338,6 +377,12 @@ class SCQubitsModel(Model):
         It is a 2-d nested list, in the plot,
         a different color will be used for each sublist.
         """
+        if self._latex_cache is None:
+            self._latex_cache = self._compute_control_latex()
+        # Copy so that changes by the caller do not alter the cache.
+        return [dict(labels) for labels in self._latex_cache]
+
+    def _compute_control_latex(self):
         num_qubits = self.num_qubits
         labels = [
             {f"sx{n}": r"$\sigma_x" + f"^{n}$" for n in range(num_qubits)},
@@ -291,3 +291,35 @@ def _to_array(params, num_qubits):
         return np.asarray([params] * num_qubits)
     elif isinstance(params, Iterable):
         return np.asarray(params)
+
+
+def _broadcast_params(params, sizes):
+    """
+    Transfer the parameters given in ``sizes`` to float arrays of
+    the corresponding length.
+    A scalar or a single-element array is repeated.
+    For a longer array, only the first entries are used.
+    Float arrays of exactly the given length are returned without copying.
+    """
+    result = {}
+    for name, size in sizes.items():
+        value = params[name]
+        if (
+            isinstance(value, np.ndarray)
+            and value.dtype == np.float64
+            and value.shape == (size,)
+        ):
+            result[name] = value
+            continue
+        value = np.atleast_1d(np.asarray(value, dtype=float))
+        if len(value) == 1:
+            value = np.full(size, value[0])
+        elif len(value) >= size:
+            value = value[:size].copy()
+        else:
+            raise ValueError(
+                f"The parameter {name} requires {size} values, "
+                f"but only {len(value)} are given."
+            )
+        result[name] = value
+    return result
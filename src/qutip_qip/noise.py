@@ -5,7 +5,7 @@ from collections.abc import Iterable
 from copy import deepcopy
 import numpy as np
 
-from qutip import Qobj, QobjEvo, basis, sigmaz, destroy, num, qeye, tensor
+from qutip import Qobj, QobjEvo, sigmaz, destroy, num
 from .operations import expand_operator
 from .pulse import Pulse
 
@@ -566,30 +566,16 @@ class ZZCrossTalk(Noise):
         wq = self.params["wq"]
         alpha = self.params["alpha"]
         omega = self.params["omega_cr"]
+        from .device.circuitqed import _transmon_ops
+
         for i in range(len(dims) - 1):
             d1 = dims[i]
             d2 = dims[i + 1]
-            destroy_op1 = destroy(d1)
-            destroy_op2 = destroy(d2)
-            projector1 = (
-                basis(d1, 0) * basis(d1, 0).dag()
-                + basis(d1, 1) * basis(d2, 1).dag()
-            )
-            projector2 = (
-                basis(d2, 0) * basis(d2, 0).dag()
-                + basis(d2, 1) * basis(d2, 1).dag()
-            )
-            z1 = (
-                projector1
-                * (destroy_op1.dag() * destroy_op1 * 2 - qeye(d1))
-                * projector1
-            )
-            z2 = (
-                projector2
-                * (destroy_op2.dag() * destroy_op2 * 2 - qeye(d1))
-                * projector2
+            # Pauli Z projected to the qubit subspace of each transmon
+            zz_op = Qobj(
+                np.kron(_transmon_ops(d1)["z01"], _transmon_ops(d2)["z01"]),
+                dims=[[d1, d2], [d1, d2]],
             )
-            zz_op = tensor(z1, z2)
             zz_coeff = (
                 1 / (wq[i] - wr[i] - alpha[i + 1])
                 - 1 / (wq[i] - wr[i] + alpha[i])
@@ -0,0 +1,4 @@
+# This file is automatically generated by qutip-qip's setup.py.
+short_version = '0.4.0.dev0'
+version = '0.4.0.dev0+0c2d7df'
+release = False
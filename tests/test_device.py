@@ -1,4 +1,3 @@
-from itertools import product
 from functools import reduce
 from operator import mul
 
@@ -44,19 +43,35 @@ single_gate_tests = [
 
 
 def _ket_expaned_dims(qubit_state, expanded_dims):
-    all_qubit_basis = list(product([0, 1], repeat=len(expanded_dims)))
-    old_dims = qubit_state.dims[0]
+    num_qubits = len(expanded_dims)
+    # All qubit basis states as index arrays, one row per subsystem.
+    all_qubit_basis = np.indices((2,) * num_qubits).reshape(num_qubits, -1)
+    old_ind = np.ravel_multi_index(all_qubit_basis, qubit_state.dims[0])
+    new_ind = np.ravel_multi_index(all_qubit_basis, expanded_dims)
     expanded_qubit_state = np.zeros(
         reduce(mul, expanded_dims, 1), dtype=np.complex128)
-    for basis_state in all_qubit_basis:
-        old_ind = np.ravel_multi_index(basis_state, old_dims)
-        new_ind = np.ravel_multi_index(basis_state, expanded_dims)
-        expanded_qubit_state[new_ind] = qubit_state[old_ind, 0]
-    expanded_qubit_state.reshape((reduce(mul, expanded_dims, 1), 1))
+    expanded_qubit_state[new_ind] = qubit_state.full()[old_ind, 0]
     return qutip.Qobj(
         expanded_qubit_state, dims=[expanded_dims, [1]*len(expanded_dims)])
 
 
+@pytest.fixture(scope="module")
+def device_cache():
+    """
+    Devices shared by the numerical tests of this module.
+    ``load_circuit`` clears the existing pulses, so a device can be reused
+    as long as each test loads its own circuit before running it.
+    """
+    return {}
+
+
+def _get_device(device_cache, device_class, num_qubits, kwargs):
+    key = (device_class, num_qubits, repr(sorted(kwargs.items())))
+    if key not in device_cache:
+        device_cache[key] = device_class(num_qubits, **kwargs)
+    return device_cache[key]
+
+
 device_lists_analytic = [
     pytest.param(DispersiveCavityQED, {"g":0.1}, id = "DispersiveCavityQED"),
     pytest.param(LinearSpinChain, {}, id = "LinearSpinChain"),
@@ -102,12 +117,12 @@ def test_analytical_evolution(num_qubits, gates, device_class, kwargs):
 @pytest.mark.parametrize(("num_qubits", "gates"), single_gate_tests)
 @pytest.mark.parametrize(("device_class", "kwargs"), device_lists_numeric)
 def test_numerical_evolution(
-    num_qubits, gates, device_class, kwargs):
+    num_qubits, gates, device_class, kwargs, device_cache):
     num_qubits = 2
     circuit = QubitCircuit(num_qubits)
     for gate in gates:
         circuit.add_gate(gate)
-    device = device_class(num_qubits, **kwargs)
+    device = _get_device(device_cache, device_class, num_qubits, kwargs)
     device.load_circuit(circuit)
 
     state = qutip.rand_ket(2**num_qubits)
@@ -148,6 +163,7 @@ circuit.add_gate("Z", targets=[1])
 circuit.add_gate("X", targets=[1])
 
 from copy import deepcopy
+# Evaluated once at import, not per test, so deepcopy is acceptable here.
 circuit2 = deepcopy(circuit)
 circuit2.add_gate("SQRTISWAP", targets=[0, 2])  # supported only by SpinChain
 
@@ -161,10 +177,11 @@ circuit2.add_gate("SQRTISWAP", targets=[0, 2])  # supported only by SpinChain
     pytest.param(circuit, SCQubits, {"omega_single":[0.02]*3}, id = "SCQubits"),
 ])
 @pytest.mark.parametrize(("schedule_mode"), ["ASAP", "ALAP", None])
-def test_numerical_circuit(circuit, device_class, kwargs, schedule_mode):
+def test_numerical_circuit(
+    circuit, device_class, kwargs, schedule_mode, device_cache):
     num_qubits = circuit.N
     with warnings.catch_warnings(record=True):
-        device = device_class(circuit.N, **kwargs)
+        device = _get_device(device_cache, device_class, circuit.N, kwargs)
     device.load_circuit(circuit, schedule_mode=schedule_mode)
 
     state = qutip.rand_ket(2**num_qubits)
@@ -259,3 +276,41 @@ def test_idling_accuracy():
     )
 
     assert error_2_gate < 2 * error_1_gate
+
+
+def test_scqubits_cross_resonance_unequal_dims():
+    # The ZX and XZ operators act on [m, m+1] for neighbours of
+    # different dimensions.
+    def proj01(d):
+        return qutip.basis(d, 0).proj() + qutip.basis(d, 1).proj()
+
+    def z(d):
+        return proj01(d) * (qutip.qeye(d) - 2 * qutip.num(d)) / 2 * proj01(d)
+
+    def x(d):
+        return proj01(d) * (qutip.create(d) + qutip.destroy(d)) / 2 * proj01(d)
+
+    model = SCQubits(2, dims=[2, 4]).model
+    zx, targets = model.get_control("zx01")
+    assert targets == [0, 1]
+    assert (zx - 2 * np.pi * qutip.tensor(z(2), x(4))).norm() < 1.e-12
+    xz, targets = model.get_control("zx10")
+    assert targets == [0, 1]
+    assert (xz - 2 * np.pi * qutip.tensor(x(2), z(4))).norm() < 1.e-12
+
+
+def test_scqubits_control_latex_not_shared():
+    processor = SCQubits(2)
+    labels = processor.get_control_latex()
+    expected = [dict(sublist) for sublist in labels]
+    labels.append({"extra": "extra"})
+    labels[0]["sx0"] = "changed"
+    assert processor.get_control_latex() == expected
+
+
+def test_scqubits_parameter_length():
+    # Longer lists are accepted, only the first entries are used.
+    model = SCQubits(3, wr=[5.9, 6.0, 6.1]).model
+    np.testing.assert_allclose(model.params["wr"], [5.9, 6.0])
+    with pytest.raises(ValueError, match="g requires 4 values"):
+        SCQubits(3, g=[0.1, 0.1, 0.1])
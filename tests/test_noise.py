@@ -193,6 +193,32 @@ class TestNoise:
             if not isinstance(pulse, Drift) and pulse.label=="systematic_noise":
                 assert(len(pulse.coherent_noise) == 1)
 
+    def test_zz_cross_talk_unequal_dims(self):
+        # The ZZ operator of neighbours with different dimensions
+        # acts only on the qubit subspace of each of them.
+        def z(d):
+            proj01 = basis(d, 0).proj() + basis(d, 1).proj()
+            return proj01 * (2 * qutip.num(d) - qeye(d)) * proj01
+
+        dims = [3, 4, 3]
+        processor = SCQubits(3, dims=dims, zz_crosstalk=True)
+        circuit = QubitCircuit(3)
+        circuit.add_gate("X", 0)
+        processor.load_circuit(circuit)
+        pulses = processor.get_noisy_pulses(device_noise=True, drift=True)
+        noise = [
+            pulse for pulse in pulses
+            if not isinstance(pulse, Drift)
+            and pulse.label == "systematic_noise"
+        ][0].coherent_noise
+        assert len(noise) == 2
+        for i, ele in enumerate(noise):
+            assert ele.targets == [i, i + 1]
+            expected = tensor(z(dims[i]), z(dims[i + 1]))
+            assert ele.qobj.dims == expected.dims
+            scale = ele.qobj.full()[0, 0] / expected.full()[0, 0]
+            assert_allclose(ele.qobj.full(), scale * expected.full())
+
 
 class DriftNoise1(Noise):
     """Standard defintion."""